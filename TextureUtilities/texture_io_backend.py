@@ -6,7 +6,8 @@ import os
 import shutil
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
 
 import unreal
 
@@ -14,7 +15,7 @@ from ..common_utils import log
 
 from .texture_settings import (AUTO_SAVE, BACKUP_FOLDER_NAME, UNREAL_TEMP_FOLDER, EXR_SRGB_CURVE, DELETE_USED)
 
-from .texture_utils import (ensure_asset_saved, export_temporary_file, get_selected_assets, group_paths_by_folder, is_asset_data, package_to_object_path, validate_export_extension)
+from .texture_utils import (ensure_assets_saved, export_temporary_file, get_selected_assets, group_paths_by_folder, is_asset_data, package_to_object_path, validate_export_extension)
 
 
 
@@ -111,11 +112,8 @@ def resolve_work_directory(context: "CPContext") -> None:
 # Resolves the path for a temporary folder for Unreal or Windows to extract the files to.
 # Uses a path provided in config, if no valid path is available, uses the project's default path.
 
-    project_directory: str = unreal.SystemLibrary.get_project_directory()
-    default_directory: str = os.path.abspath(os.path.join(project_directory, "TemporaryFolder"))
-    temporary_directory = (UNREAL_TEMP_FOLDER or "").strip()
-
-    final_path: str = os.path.abspath(os.path.normpath(temporary_directory)) if temporary_directory else default_directory
+    default_directory: str = _default_work_directory()
+    final_path: str = UNREAL_TEMP_FOLDER or default_directory # UNREAL_TEMP_FOLDER is already absolute and normalized by the settings.
     preexisted_directory = os.path.isdir(final_path)
     try:
         os.makedirs(final_path, exist_ok = True)
@@ -146,9 +144,13 @@ def prepare_workspace(context: "CPContext") -> None:
 
 
 # Preparing the assets:
+    content_paths: List[str] = [path for path in context.selection_paths_map if path.startswith("/Game/")]
+    unsaved_paths: Set[str] = ensure_assets_saved(content_paths, auto_save = AUTO_SAVE)
+    # Saves all dirty assets in a single call if specified in the config, returns the ones that are still unsaved.
+
     saved_asset_only_paths: Dict[str, str] = {}
-    for selection_path in list(context.selection_paths_map.keys()):
-        if ensure_asset_saved(selection_path, auto_save = AUTO_SAVE):
+    for selection_path in context.selection_paths_map:
+        if selection_path.startswith("/Game/") and selection_path not in unsaved_paths:
             saved_asset_only_paths[selection_path] = ""
         else:
             log(f"Skipping unsaved asset: {selection_path}", "warn")
@@ -171,7 +173,7 @@ def prepare_workspace(context: "CPContext") -> None:
 
 
 # Exporting assets:
-        for package_path in sorted(set(package_paths)):
+        for package_path in package_paths: # Already unique and sorted by group_paths_by_folder.
             asset_name: str = package_path.rsplit("/", 1)[-1]
             object_path: str = package_to_object_path(package_path)
             asset = unreal.EditorAssetLibrary.load_asset(object_path)
@@ -244,10 +246,15 @@ def cleanup(context: "CPContext") -> None:
 
     work_directory: str = context.work_directory.strip()
 
-# Deleting extracted files:
-    selection_paths: Dict[str, str] = context.selection_paths_map or {}
+# Deleting extracted files and collecting used assets:
+    selection_items: List[Tuple[str, str]] = list((context.selection_paths_map or {}).items())
     work_directory_absolute: str = os.path.abspath(os.path.normpath(context.work_directory)).replace("\\", "/")
-    for context_temporary_file_path in selection_paths.values():
+    used_package_paths: List[str] = [] # Source assets to delete from the Content Browser if DELETE_USED is set.
+
+    for package_path, context_temporary_file_path in selection_items:
+        if DELETE_USED and package_path.startswith("/Game/"):
+            used_package_paths.append(package_path)
+
         if not context_temporary_file_path:
             continue
         temporary_file_path: str = os.path.abspath(os.path.normpath(context_temporary_file_path)).replace("\\", "/")
@@ -260,18 +267,15 @@ def cleanup(context: "CPContext") -> None:
                 log(f"No permission to remove '{temporary_file_path}': {error}", "warn")
             except OSError as error:
                 log(f"Failed to remove '{temporary_file_path}': {error}", "warn")
+    # Walks the selection once for both temporary files and used assets.
 
 
 # Delete used files:
-    if DELETE_USED:
-        for package_path in (context.selection_paths_map or {}):
-            if not package_path.startswith("/Game/"):
-                continue
-
-            if unreal.EditorAssetLibrary.does_asset_exist(package_path):
-                ok: bool = unreal.EditorAssetLibrary.delete_asset(package_path)
-                if not ok:
-                    log(f"Failed to delete asset '{package_path}' from Content Browser.", "warn")
+    for package_path in used_package_paths:
+        if unreal.EditorAssetLibrary.does_asset_exist(package_path):
+            ok: bool = unreal.EditorAssetLibrary.delete_asset(package_path)
+            if not ok:
+                log(f"Failed to delete asset '{package_path}' from Content Browser.", "warn")
 
 
 # Deleting Empty folders:
@@ -286,8 +290,10 @@ def cleanup(context: "CPContext") -> None:
     elif not context.temporary_path_already_exist and is_critical_directory:
         log(f"Critical folder used as temporary directory: {work_directory}. Cleaning subfolders only.", "error")
 
+    work_directory_prefix: str = work_directory.rstrip(os.sep) + os.sep # Trailing separator, so "Temp" doesn't match "TempOther".
     for temporary_subdirectories in sorted(context.temporary_subdirectory_paths, key = lambda p: p.count(os.sep)):
-        if os.path.commonpath([work_directory, temporary_subdirectories]) != work_directory:
+        temporary_subdirectory: str = os.path.normpath(temporary_subdirectories) # Stored with forward slashes; restores native separators for the prefix check.
+        if not (temporary_subdirectory == work_directory or temporary_subdirectory.startswith(work_directory_prefix)):
             continue
 
         for root, _, _ in os.walk(temporary_subdirectories, topdown = False):
@@ -296,3 +302,15 @@ def cleanup(context: "CPContext") -> None:
             except OSError:
                 pass
     # Removes only empty directories under each created subdir.
+
+
+
+
+#                                       === helpers ===
+
+@lru_cache(maxsize = 1)
+def _default_work_directory() -> str:
+# Returns the project's default temporary folder; the project directory doesn't change during an editor session.
+
+    project_directory: str = unreal.SystemLibrary.get_project_directory()
+    return os.path.abspath(os.path.join(project_directory, "TemporaryFolder"))
@@ -2,28 +2,38 @@
 """ Global settings and constants shared across all texture modules. """
 
 import json
+import os
 from pathlib import Path
-from typing import Dict, List, NamedTuple, Set
-import unreal
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Set
+
+if TYPE_CHECKING:
+    import unreal
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+# Optional faster JSON parser; falls back to the stdlib json when it isn't installed in Unreal's Python environment.
 
 from .texture_classes import TextureTypeConfig
 
 
 class CompressionSettings(NamedTuple):
-    texture_compression_type: unreal.TextureCompressionSettings
+    texture_compression_type: "unreal.TextureCompressionSettings"
     default_srgb: bool
 # Unreal's texture compression settings.
 
 
+_TRUE_STRINGS = frozenset({"1", "true", "yes", "on", "y", "t"}) # String values from .json treated as True.
+
 def _as_bool(v) -> bool:
 # Converts .json input (bool/int/str/None) to a real bool;
 # Avoids the case where a non-empty string like "False" is treated as True.
 
-    if isinstance(v, bool): return v
+    if v is True or v is False: return v
+    if v is None: return False
     if isinstance(v, str):
-        input_str = v.strip().lower()
-        if input_str == "": return False
-        return input_str in ("1","true","yes","on")
+        return v.strip().lower() in _TRUE_STRINGS
     return bool(v)
 
 
@@ -32,8 +42,10 @@ def _as_bool(v) -> bool:
 
 _BASE_DIR = Path(__file__).resolve().parents[1]
 _config_path = _BASE_DIR / "config_TextureUtilities.json"
-with _config_path.open("r", encoding="utf-8") as f:
-    _config_data = json.load(f)
+if orjson is not None:
+    _config_data = orjson.loads(_config_path.read_bytes())
+else:
+    _config_data = json.loads(_config_path.read_text(encoding="utf-8"))
 
 
 # Global Values:
@@ -45,7 +57,8 @@ DEBUG: bool = _as_bool(_global_cfg.get("DEBUG", False))
 # Generators:
 _generators_cfg = _config_data.get("generators", {})
 FILE_TYPE: str = _generators_cfg.get("FILE_TYPE", "png").strip() # File type extension for temporary texture files created outside Unreal.
-UNREAL_TEMP_FOLDER: str = _generators_cfg.get("UNREAL_TEMP_FOLDER", "").strip() # Destination folder for exporting source textures for channel packing.
+_unreal_temp_folder: str = _generators_cfg.get("UNREAL_TEMP_FOLDER", "").strip()
+UNREAL_TEMP_FOLDER: str = os.path.abspath(os.path.normpath(_unreal_temp_folder)) if _unreal_temp_folder else "" # Destination folder for exporting source textures for channel packing. Normalized to an absolute path once at load.
 BACKUP_FOLDER_NAME: str = _generators_cfg.get("BACKUP_FOLDER_NAME", "").strip() # If provided, moves source maps used during generation into a backup folder after creating the channel-packed map.
 EXR_SRGB_CURVE: bool = _as_bool(_generators_cfg.get("EXR_SRGB_CURVE", True)) # If true, applies sRGB gamma transform when converting the .exr, mimicking Photoshop behavior, when converting with gamma 1.0/exposure 0.0
 DELETE_USED: bool = _as_bool(_generators_cfg.get("DELETE_USED", False)) # If true, deletes the files used by the function.
@@ -94,13 +107,21 @@ TEXTURE_CONFIG: dict[str, TextureTypeConfig] = {
 # The G/RGB image type is used by validate_packing_modes to ensure that an RGB image is not mapped to a single channel without explicitly specifying the channel using .R or _R.
 
 
-COMPRESSION_TYPES: Dict[str, CompressionSettings] = {
-    "Default":        CompressionSettings(unreal.TextureCompressionSettings.TC_DEFAULT, True),
-    "Normalmap":      CompressionSettings(unreal.TextureCompressionSettings.TC_NORMALMAP, False),
-    "Masks":          CompressionSettings(unreal.TextureCompressionSettings.TC_MASKS, False),
-    "Grayscale":      CompressionSettings(unreal.TextureCompressionSettings.TC_GRAYSCALE, False),
-    "Displacementmap":CompressionSettings(unreal.TextureCompressionSettings.TC_DISPLACEMENTMAP, False),
-}
+def __getattr__(name: str):
+# Builds COMPRESSION_TYPES on first access, so importing the settings doesn't load the unreal module.
+
+    if name == "COMPRESSION_TYPES":
+        import unreal
+        compression_types: Dict[str, CompressionSettings] = {
+            "Default":        CompressionSettings(unreal.TextureCompressionSettings.TC_DEFAULT, True),
+            "Normalmap":      CompressionSettings(unreal.TextureCompressionSettings.TC_NORMALMAP, False),
+            "Masks":          CompressionSettings(unreal.TextureCompressionSettings.TC_MASKS, False),
+            "Grayscale":      CompressionSettings(unreal.TextureCompressionSettings.TC_GRAYSCALE, False),
+            "Displacementmap":CompressionSettings(unreal.TextureCompressionSettings.TC_DISPLACEMENTMAP, False),
+        }
+        globals()["COMPRESSION_TYPES"] = compression_types # Later lookups hit the module dict directly.
+        return compression_types
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 TEXTURE_PREFIXES: List[str] = ["t","tex","tx"] # Prefixes to strip when deriving a clean texture name.
 
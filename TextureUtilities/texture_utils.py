@@ -4,8 +4,11 @@
 
 import os
 import re
+from bisect import bisect_left
 from collections import defaultdict
-from typing import (Dict, Iterable, List, Optional, Set, Tuple)
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import (Dict, FrozenSet, Iterable, List, Optional, Set, Tuple)
 
 import unreal
 
@@ -19,6 +22,43 @@ from .texture_settings import (ALLOWED_FILE_TYPES, COMPRESSION_TYPES, FILE_TYPE,
 
 
 
+#                                      === Precompiled patterns ===
+
+_NORMALIZED_SIZE_SUFFIXES: List[str] = sorted({size_suffix.lower() for size_suffix in SIZE_SUFFIXES if size_suffix}, key=len, reverse=True)
+# Normalizes tokens to lowercase, drops case-only duplicates (e.g., "2K" and "2k") and sorts by reverse length to avoid shorter tokens matching before longer ones.
+_SIZE_SUFFIX_ALTERNATION: str = "|".join(map(re.escape, _NORMALIZED_SIZE_SUFFIXES))
+_SIZE_SUFFIX_RE: Optional[re.Pattern[str]] = re.compile(
+    r"^.*?[\._\-](" + _SIZE_SUFFIX_ALTERNATION + r")$"  # e.g., "_2k" at the end of the name.
+    r"|[\._\-](" + _SIZE_SUFFIX_ALTERNATION + r")(?:-[a-z0-9]+)?(?=[\._\-][a-z0-9]+$)"  # e.g., "_2k_roughness" or "_2k-v2_roughness".
+) if _NORMALIZED_SIZE_SUFFIXES else None
+# Single pattern for both conventions; the anchored first branch is only tried at the start, so a suffix at the very end takes priority.
+
+_SUFFIX_SEPARATOR: str = r"[\_\-\.]" # Separators allowed between name tokens.
+_SUFFIX_MIDDLE_TEXT: str = rf"(?:{_SUFFIX_SEPARATOR}[A-Za-z0-9]+)?" # Optional extra token between the type and size suffixes.
+
+_TYPE_SUFFIXES_FLAT: List[str] = [type_suffix.lower() for config in TEXTURE_CONFIG.values() for type_suffix in config.get("suffixes", [])]
+# All type suffixes in TEXTURE_CONFIG order, lowercased once.
+
+_RESOLUTION_THRESHOLDS: Tuple[int, ...] = (512, 1024, 2048, 4096, 8192)
+_RESOLUTION_LABELS: Tuple[str, ...] = ("512", "1K", "2K", "4K", "8K")
+# Largest image side that still maps to each size suffix label.
+
+_COMPRESSION_BY_TYPE: Dict[unreal.TextureCompressionSettings, CompressionSettings] = {setting.texture_compression_type: setting for setting in COMPRESSION_TYPES.values()}
+_COMPRESSION_BY_LABEL_LOWER: Dict[str, CompressionSettings] = {label.lower(): setting for label, setting in COMPRESSION_TYPES.items()}
+_DEFAULT_COMPRESSION: Optional[CompressionSettings] = COMPRESSION_TYPES.get("Default")
+# Compression settings indexed by Unreal's TC_ value and by the lowercase config label, plus the fallback setting.
+
+_TEXTURE_PREFIXES_ALTERNATION: str = "|".join(map(re.escape, sorted({prefix.lower() for prefix in TEXTURE_PREFIXES if prefix}, key=len, reverse=True)))
+_TEXTURE_PREFIX_RE: Optional[re.Pattern[str]] = re.compile(rf"(?i)^(?:{_TEXTURE_PREFIXES_ALTERNATION})[\._\-]+") if _TEXTURE_PREFIXES_ALTERNATION else None # e.g. "T_"
+
+_ALL_PREFIX_LENGTH: int = len("/All") # Content Browser's virtual root prepended to e.g. /All/Game/...
+
+_ALLOWED_EXT_SET: FrozenSet[str] = frozenset(ALLOWED_FILE_TYPES)
+_EXT_ALIASES: Dict[str, str] = {"jpeg": "jpg"}
+# Export extensions accepted from config and the aliases they are normalized to.
+
+
+
 
 def check_texture_suffix_mismatch(texture: TextureMapData) -> Optional[MapNameAndResolution]:
 # Checks a single texture if its declared size suffix in the name (if present) matches its actual resolution.
@@ -26,9 +66,17 @@ def check_texture_suffix_mismatch(texture: TextureMapData) -> Optional[MapNameAn
     if not getattr(texture, "resolution", None):
         return None
     declared_suffix: str = (texture.suffix or "").lower().lstrip("_")
-    declared_suffix = re.split(r"[-_.]", declared_suffix, maxsplit=1)[0]
-    expected_suffix: str = resolution_to_suffix(texture.resolution).lower().lstrip("_")
-    if declared_suffix and declared_suffix != expected_suffix:
+    if not declared_suffix:
+        return None
+    for index, character in enumerate(declared_suffix): # Keeps only the text before the first separator, e.g., "2k_1" > "2k".
+        if character in "-_.":
+            declared_suffix = declared_suffix[:index]
+            break
+    if not declared_suffix:
+        return None
+
+    expected_suffix: str = resolution_to_suffix(texture.resolution).lower()
+    if declared_suffix != expected_suffix:
         return MapNameAndResolution(texture.filename, texture.resolution)
     return None
 
@@ -36,98 +84,83 @@ def check_texture_suffix_mismatch(texture: TextureMapData) -> Optional[MapNameAn
 def close_image_files(images: Iterable[Optional[object]]) -> None:
 # Safely closes all opened images even if there is an error during image processing, prevents closing the same file twice.
 
-    processed_ids: Set[int] = set()
-    for image in images:
-        if image is None:
-            continue
-        image_id = id(image)
-        if image_id in processed_ids:
-            continue
-        processed_ids.add(image_id)
+    unique_images: Dict[int, object] = {id(image): image for image in images if image is not None} # Keyed by identity; keeps the first-seen order.
+    for image in unique_images.values():
         try:
             close_image(image)
         except (OSError, ValueError):
             pass
 
 
-def detect_size_suffix(name: str) -> str:
+def detect_size_suffix(name: str, *, name_lower: Optional[str] = None) -> str:
     # Detects size suffixes present in the map name, e.g., "2K"
+    # Callers that already have the lowercase name can pass it to skip lowercasing again.
 
-    normalized_size_suffixes: List[str] = sorted(
-        [size_suffix.lower() for size_suffix in SIZE_SUFFIXES if size_suffix], key=len, reverse=True)
-    # Normalizes tokens to lowercase and sorts by reverse length to avoid shorter tokens matching before longer ones.
-    if not normalized_size_suffixes:
+    if _SIZE_SUFFIX_RE is None:
         return ""
-    pattern = r"(?:[\._\-])(" + "|".join(map(re.escape, normalized_size_suffixes)) + r")$"
-    # Tries to match suffix variants to the map name
-    matched_suffix: Optional[re.Match[str]] = re.search(pattern, name.lower())
-    if matched_suffix:
-        return matched_suffix.group(1)
-    alt_pattern: str = r"(?:[\._\-])(" + "|".join(
-        map(re.escape, normalized_size_suffixes)) + r")(?:-[a-z0-9]+)?(?=[\._\-][a-z0-9]+$)"
-    alt_match: Optional[re.Match[str]] = re.search(alt_pattern, name.lower())
-    return alt_match.group(1) if alt_match else ""
+    if name_lower is None:
+        name_lower = name.lower()
+    matched_suffix: Optional[re.Match[str]] = _SIZE_SUFFIX_RE.search(name_lower)
+    return (matched_suffix.group(1) or matched_suffix.group(2)) if matched_suffix else ""
     # Returns the captured token e.g., '2k' if able to find one
 
 
 def derive_texture_name(file_name: str) -> str:
 # Extracts texture name from the file's name.
 
-    file_name_lower: str = file_name.lower() # Normalized filename.
-    separator = r"[\._\-]"
-    initial_size_suffix: Optional[str] = detect_size_suffix(file_name) or "" # used to find suffixes in the style of: "_roughness_2k", "_2K-roughness", etc.
+    file_name_lower: str = file_name.lower() # Normalized filename; all pattern matching runs on it, positions are applied to the original.
+    same_length: bool = len(file_name_lower) == len(file_name) # Lowercasing can change the length, e.g., "İ"; positions are then found on the original name instead.
+    initial_size_suffix: Optional[str] = detect_size_suffix(file_name, name_lower = file_name_lower) or "" # used to find suffixes in the style of: "_roughness_2k", "_2K-roughness", etc.
 
 # Removing type suffix:
     found_suffix_position: Optional[int] = None
-    for _, config in TEXTURE_CONFIG.items():
-        for type_suffix in (s.lower() for s in config.get("suffixes", [])):
-            pattern: Optional[str] = match_suffixes(file_name_lower, type_suffix, (initial_size_suffix or None))
-            if not pattern:
-                continue
-            match: Optional[re.Match[str]] = re.search(pattern, file_name, flags = re.IGNORECASE)
-            if not match:
-                continue
+    for type_suffix in _TYPE_SUFFIXES_FLAT:
+        match: Optional[re.Match[str]] = _match_suffix_pattern(file_name_lower, type_suffix, (initial_size_suffix or None))
+        if match and not same_length:
+            match = re.search(match.re.pattern, file_name, flags = re.IGNORECASE)
+        if match:
             found_suffix_position = match.start()
             break
-        if found_suffix_position is not None:
-            break
     stripped_name = (file_name[:found_suffix_position] if found_suffix_position is not None else file_name).rstrip("_-.")
+    stripped_name_lower: str = file_name_lower[:len(stripped_name)] if same_length else stripped_name.lower()
 
 # Removing size suffix:
-    processed_size_suffix = detect_size_suffix(stripped_name)
+    if initial_size_suffix and stripped_name_lower.endswith(initial_size_suffix):
+        processed_size_suffix = initial_size_suffix
+    else:
+        processed_size_suffix = detect_size_suffix(stripped_name, name_lower = stripped_name_lower)
+    # Reuses the size suffix found earlier if the name still ends with it, e.g., "Rock_2K_Roughness" > "Rock_2K".
     if processed_size_suffix:
-        stripped_name = re.sub(rf"{separator}{re.escape(processed_size_suffix)}$", "", stripped_name, flags = re.IGNORECASE)
+        suffix_length: int = len(processed_size_suffix) + 1 # Size token with its leading separator.
+        trailing_text: str = stripped_name_lower[-suffix_length:]
+        if len(stripped_name) >= suffix_length and trailing_text[0] in "._-" and trailing_text[1:] == processed_size_suffix:
+            stripped_name = stripped_name[:-suffix_length]
+    # Strips the size token only if it ends the name, e.g., "Rock_2K" > "Rock".
 
 # Removing texture prefix:
-    asset_type_prefixes = [prefix.lower() for prefix in TEXTURE_PREFIXES if prefix]
-    if asset_type_prefixes:
-        prefixes_alt = "|".join(sorted(set(asset_type_prefixes), key=len, reverse=True))
-        stripped_name = re.sub(rf"(?i)^(?:{prefixes_alt})[\._\-]+", "", stripped_name)
+    if _TEXTURE_PREFIX_RE is not None:
+        stripped_name = _TEXTURE_PREFIX_RE.sub("", stripped_name)
     #  e.g. "T_"
 
     return stripped_name
 
 
-def ensure_asset_saved(package_path: str, *, auto_save: bool) -> bool:
-# Checks if the selected asset needed by the script is saved in Content Browser.
+def ensure_assets_saved(package_paths: Iterable[str], *, auto_save: bool) -> Set[str]:
+# Checks if the selected assets needed by the script are saved in Content Browser.
 # Assumes the object and package name are the same.
-# Returns a flag if all assets are saved or not.
+# If auto_save is set, saves all unsaved assets with a single call, then re-checks them.
+# Returns the package paths that are still unsaved.
 
 # Checking the file status:
-    if not package_path or not package_path.startswith("/Game/"):
-        return False
+    package_paths = list(package_paths)
+    unsaved_paths: Set[str] = gather_unsaved_packages(package_paths)
+    if not unsaved_paths or not auto_save:
+        return unsaved_paths
 
-    if not auto_save:
-        return True
-
-# Auto-saving the file:
-    object_path = package_to_object_path(package_path)
-    object_ = unreal.EditorAssetLibrary.load_asset(object_path)
-    package = object_.get_outermost()  # Gets asset's package.
-    ok = bool(unreal.EditorLoadingAndSavingUtils.save_packages([package], only_dirty=True))
-    if ok:
-        return True
-    return False
+# Auto-saving the files:
+    unsaved_assets = [unreal.EditorAssetLibrary.load_asset(package_to_object_path(package_path)) for package_path in sorted(unsaved_paths)]
+    unreal.EditorAssetLibrary.save_loaded_assets([asset for asset in unsaved_assets if asset], only_if_is_dirty = True)
+    return gather_unsaved_packages(package_paths)
 
 
 def export_temporary_file(asset: "unreal.Texture2D", out_directory: str, asset_name: str, package_path: str, extension:str = "png", *, exr_srgb_curve: bool = True) -> Tuple[Optional[str], bool]:
@@ -136,15 +169,11 @@ def export_temporary_file(asset: "unreal.Texture2D", out_directory: str, asset_n
 
 # default export:
     ext_norm: str = "." + extension.lstrip(".") # In case the extension is already set with the dot.
-    os.makedirs(out_directory, exist_ok=True)
-    final_path = os.path.join(out_directory, f"{asset_name}{ext_norm}")
+    out_directory_norm: str = os.path.abspath(out_directory).replace("\\", "/") # Absolutized once, both export paths are built from it.
+    os.makedirs(out_directory_norm, exist_ok=True)
+    final_path: str = f"{out_directory_norm}/{asset_name}{ext_norm}"
 
-    default_image = unreal.AssetExportTask()
-    default_image.object = asset
-    default_image.filename = final_path
-    default_image.automated = True
-    default_image.prompt = False
-    default_image.replace_identical = True
+    default_image: "unreal.AssetExportTask" = _new_export_task(asset, final_path)
 
     image_ok: bool = False
     try:
@@ -155,21 +184,16 @@ def export_temporary_file(asset: "unreal.Texture2D", out_directory: str, asset_n
             log(f"{ext_norm} export raised exception for '{package_path}': {e}", "warn")
 
     if image_ok and os.path.isfile(final_path):
-        return os.path.abspath(final_path).replace("\\", "/"), was_float
+        return final_path, was_float
 
 
 # .exr fallback export for 32bit textures:
-    use_exr: bool = check_exr_libraries()
+    use_exr: bool = check_exr_libraries() # Memoized, the subprocess check runs once per session.
     if use_exr:
         log(f"Exporting the '{asset_name}' as .exr", "info")
 
-        final_exr = os.path.join(out_directory, f"{asset_name}.exr")
-        exr_image = unreal.AssetExportTask()
-        exr_image.object = asset
-        exr_image.filename = final_exr
-        exr_image.automated = True
-        exr_image.prompt = False
-        exr_image.replace_identical = True
+        final_exr: str = f"{out_directory_norm}/{asset_name}.exr"
+        exr_image: "unreal.AssetExportTask" = _new_export_task(asset, final_exr) # Only created when the libraries are available.
 
         exr_ok: bool = False
         try:
@@ -184,8 +208,7 @@ def export_temporary_file(asset: "unreal.Texture2D", out_directory: str, asset_n
                 log(f"EXR export failed or missing file: {final_exr}", "error")
             return None, was_float
 
-        exr_path_absolute: str = os.path.abspath(final_exr).replace("\\", "/")
-        final_path: str = exr_to_image(exr_path_absolute, output_extension=extension, srgb_transform=exr_srgb_curve)
+        final_path = exr_to_image(final_exr, output_extension=extension, srgb_transform=exr_srgb_curve)
 
         if final_path:
             was_float = True
@@ -202,16 +225,23 @@ def export_temporary_file(asset: "unreal.Texture2D", out_directory: str, asset_n
 
 
 
+def gather_unsaved_packages(package_paths: Iterable[str]) -> Set[str]:
+# Returns the package paths that have unsaved changes, using one query for all dirty content packages.
+
+    dirty_packages = unreal.EditorLoadingAndSavingUtils.get_dirty_content_packages() or []
+    dirty_package_names: Set[str] = {str(package.get_name()) for package in dirty_packages} # Package names are package paths, e.g., /Game/A/B/Asset.
+    return {package_path for package_path in package_paths if package_path in dirty_package_names}
+
+
 def get_selected_assets(*, recursive: bool = False) -> List[str]:
 # Sorts out the selection and run function to collect the asset's package paths accordingly.
 # If folders are present in the selection, then it lists assets in folders only.
 
     folders: list[str] = list(unreal.EditorUtilityLibrary.get_selected_folder_paths() or [])
     if folders:
-        assets_in_folders = set()
-        for folder in folders:
-            assets_in_folders.update(list_assets_in_folder(folder, recursive=recursive))
-        return sorted(assets_in_folders)
+        stripped_folders = (str(folder).strip() for folder in folders)
+        folder_paths: List[str] = [normalize_content_browser_folder_path(folder) for folder in stripped_folders if folder] # Removes the /All/ root if necessary.
+        return list_assets_in_folders(folder_paths, recursive=recursive)
     # Gets assets in the selected folders only.
 
     directly_selected:List[str] = list_selected_assets()
@@ -227,7 +257,7 @@ def get_texture_compression_settings(input_setting_name: str) -> Tuple[unreal.Te
 
     input_name = (input_setting_name or "").strip()
 
-    default_setting: CompressionSettings = COMPRESSION_TYPES.get("Default")
+    default_setting: CompressionSettings = _DEFAULT_COMPRESSION
     default_texture_compression = default_setting.texture_compression_type
     default_srgb = default_setting.default_srgb
     valid_setting: bool = False
@@ -241,10 +271,7 @@ def get_texture_compression_settings(input_setting_name: str) -> Tuple[unreal.Te
     if compression_name_upper.startswith("TC_"):
         texture_compression_type = getattr(unreal.TextureCompressionSettings, compression_name_upper, None)
         if texture_compression_type is not None:
-            setting_for_label = next(
-                (setting for setting in COMPRESSION_TYPES.values() if setting.texture_compression_type == texture_compression_type),
-                None
-            )
+            setting_for_label: Optional[CompressionSettings] = _COMPRESSION_BY_TYPE.get(texture_compression_type)
             srgb_for_setting = setting_for_label.default_srgb if setting_for_label is not None else default_srgb
             valid_setting = True
             return texture_compression_type, srgb_for_setting, valid_setting
@@ -253,10 +280,10 @@ def get_texture_compression_settings(input_setting_name: str) -> Tuple[unreal.Te
     # e.g., when user input TC_DEFAULT instead of Default.
 
 
-    for label, setting in COMPRESSION_TYPES.items():
-        if label.lower() == input_name.lower():
-            valid_setting = True
-            return setting.texture_compression_type, setting.default_srgb, valid_setting
+    setting: Optional[CompressionSettings] = _COMPRESSION_BY_LABEL_LOWER.get(input_name.lower())
+    if setting is not None:
+        valid_setting = True
+        return setting.texture_compression_type, setting.default_srgb, valid_setting
 
 
     return default_texture_compression, default_srgb, valid_setting # Unknown setting name
@@ -266,23 +293,24 @@ def group_paths_by_folder(keys: Iterable[str]) -> Dict[str, List[str]]:
 # Builds a dictionary that groups asset package paths by their parent folder relative to /Game/ folder in Content
 # Browser. Used to determine the final temporary submodule for export. Works with package and object paths. e.g.,
 # Game/Textures/Brick/T_Brick_BaseColor > Textures/Brick: Game/Textures/Brick/T_Brick_Normal
+# Each folder's list is sorted and contains unique paths.
 
-    package_paths_by_folder: Dict[str, List[str]] = defaultdict(list)
+    package_paths_by_folder: Dict[str, Set[str]] = defaultdict(set)
 
     for key in keys:
         if not isinstance(key, str) or not key:
             continue
 
-        pkg = key.split(".", 1)[0] # Normalizes paths to package paths, in case object paths are provided: /Game/A/B/Asset.Asset > Game/A/B/Asset.
+        pkg = key.partition(".")[0] # Normalizes paths to package paths, in case object paths are provided: /Game/A/B/Asset.Asset > Game/A/B/Asset.
         if not pkg.startswith("/Game/"):
             continue
-        rel = pkg.removeprefix("/Game/")  # Gets the path to the asset relative to the root Game folder.
+        rel = pkg[6:]  # Gets the path to the asset relative to the root Game folder, i.e., without the "/Game/".
 
-        parent = rel.rsplit("/", 1)[0] if "/" in rel else "" # Selects asset parent folder.
-        folder_label = parent if parent else "."
-        package_paths_by_folder[folder_label].append(key)
+        parent = rel.rpartition("/")[0] # Selects asset parent folder; empty for assets directly in /Game/.
+        folder_label = parent or "."
+        package_paths_by_folder[folder_label].add(key)
 
-    return {g: sorted(v) for g, v in sorted(package_paths_by_folder.items(), key=lambda kv: kv[0])}
+    return dict(sorted(((g, sorted(v)) for g, v in package_paths_by_folder.items()), key = itemgetter(0)))
 
 
 def is_asset_data(asset: unreal.AssetData, asset_type: str) -> bool:
@@ -302,7 +330,7 @@ def is_asset_data(asset: unreal.AssetData, asset_type: str) -> bool:
 
 def is_power_of_two(n: int) -> bool:
     # Returns True if n is a power of two (n > 0).
-    return (n & (n - 1) == 0) and n != 0
+    return n > 0 and n.bit_count() == 1
 
 
 def list_assets_in_folder(path: Optional[str] = None, *, recursive: bool = False) -> List[str]:
@@ -311,14 +339,13 @@ def list_assets_in_folder(path: Optional[str] = None, *, recursive: bool = False
 # Recursive is not used now, and left as False.
 
 # Resolving target folder:
-    registry = unreal.AssetRegistryHelpers.get_asset_registry()
     folder_paths: List[str] = []
 
     if isinstance(path, str) and path.strip():
         folder_paths = [normalize_content_browser_folder_path(path.strip())] # Removes the /All/ root if necessary.
     # Uses the provided path and ignores the Content Browser selection.
     else:
-        content_browser_subsystem = unreal.get_editor_subsystem(unreal.ContentBrowserSubsystem)
+        content_browser_subsystem = _get_content_browser_subsystem()
         selected_paths = content_browser_subsystem.get_selected_paths() or []
         folder_paths = [normalize_content_browser_folder_path(str(p)) for p in selected_paths] # Removes the /All/ root if necessary.
     # Gets the folder selected in Content Browser.
@@ -327,20 +354,29 @@ def list_assets_in_folder(path: Optional[str] = None, *, recursive: bool = False
         log("No folder path provided or folders selected.", "warn")
         return []
 
-# Building an asset paths list from all chosen folders:
-    assets_package_paths: Set[str] = set()
+    return list_assets_in_folders(folder_paths, recursive=recursive)
 
-    for folder in folder_paths:
-        asset_data_list = registry.get_assets_by_path(
-            folder,
-            recursive=recursive,
-            include_only_on_disk_assets=False,
-        )
-        for asset_data in asset_data_list:
-            package_name = getattr(asset_data, "package_name", None)  # e.g., /Game/.../Asset
-            if package_name:
-                assets_package_paths.add(str(package_name))
-    #  Builds a list containing AssetData metadata for each asset in the folder
+
+def list_assets_in_folders(folder_paths: Iterable[str], *, recursive: bool = False) -> List[str]:
+# List assets package paths for assets in all the given (already normalized) folders.
+# Queries the asset registry once with a filter covering every folder.
+
+    folders: List[str] = list(folder_paths)
+    if not folders:
+        return []
+
+    asset_filter = unreal.ARFilter(
+        package_paths=folders,
+        recursive_paths=recursive,
+        include_only_on_disk_assets=False,
+    )
+    asset_data_list = _get_asset_registry().get_assets(asset_filter)
+    #  Builds a list containing AssetData metadata for each asset in all the folders.
+
+    assets_package_paths: Set[str] = set()
+    for package_name in map(attrgetter("package_name"), asset_data_list): # e.g., /Game/.../Asset
+        if package_name:
+            assets_package_paths.add(str(package_name))
 
     return sorted(assets_package_paths)
 
@@ -350,12 +386,19 @@ def list_selected_assets() -> List[str]:
     selected_assets: List[unreal.AssetData] = list(unreal.EditorUtilityLibrary.get_selected_asset_data())
 
     assets_package_paths: Set[str] = set()
-    for asset_data in selected_assets:
-        package_name: str = getattr(asset_data, "package_name", None)
-        if package_name:
-            package_name = normalize_content_browser_folder_path(str(package_name)) # Removes the /All/ root if necessary.
-            if package_name.startswith("/Game/"):
-              assets_package_paths.add(str(package_name))  # e.g., /Game/.../Asset
+    add_package_path = assets_package_paths.add
+    normalize_path = normalize_content_browser_folder_path
+    try:
+        for asset_data in selected_assets: # The selection only holds AssetData, so the attribute is read directly.
+            package_name = asset_data.package_name
+            if package_name:
+                package_name = str(package_name)
+                if package_name.startswith("/All"):
+                    package_name = normalize_path(package_name) # Removes the /All/ root if necessary; skipped for the usual /Game/ paths.
+                if package_name.startswith("/Game/"):
+                    add_package_path(package_name)  # e.g., /Game/.../Asset
+    except AttributeError as e:
+        log(f"Unexpected item in the Content Browser selection: {e}", "warn")
 
     return sorted(assets_package_paths)
 
@@ -384,34 +427,21 @@ def match_suffixes(name_lower: str, type_suffix: str, size_suffix: str) -> Optio
     # Takes into account different naming conventions, returns the regex pattern that matches one.
     # Type...size, size...type, ...type
 
-    separator: str = r"[\_\-\.]"
-    middle_text: str = rf"(?:{separator}[A-Za-z0-9]+)?"
-
-    if size_suffix:
-        pattern1: str = rf"{separator}{re.escape(type_suffix)}{middle_text}{separator}{re.escape(size_suffix)}$"  # type ... [middle_text] ... size
-        pattern2: str = rf"{separator}{re.escape(size_suffix)}{middle_text}{separator}{re.escape(type_suffix)}$"  # size ... [middle_text] ... type
-        # Pattern3 = if more variations are necessary.
-        if re.search(pattern1, name_lower):
-            return pattern1
-        if re.search(pattern2, name_lower):
-            return pattern2
-        # Returns the first matching pattern string.
-
-    only_type_suffix: str = rf"{separator}{re.escape(type_suffix)}$"
-    if re.search(only_type_suffix, name_lower):
-        return only_type_suffix
-    # Returns this in case only the type suffix is present.
-    return None
+    match: Optional[re.Match[str]] = _match_suffix_pattern(name_lower, type_suffix, size_suffix)
+    return match.re.pattern if match else None
+    # Returns the first matching pattern string.
 
 
+@lru_cache(maxsize = 2048)
 def normalize_content_browser_folder_path(folder: str) -> str:
 # Normalizes the package path.
 # Sometimes UE classes return paths as a /All/Game/... instead of the /Game/... e.g., unreal.EditorUtilityLibrary.get_selected_folder_paths()
-    folder_path = str(folder)
+# Cached, as the same folders are normalized over and over; callers pass plain strings.
+    folder_path = folder if type(folder) is str else str(folder)
     if folder_path == "/All":
         return "/"
     if folder_path.startswith("/All/"):
-        return folder_path[4:]
+        return folder_path[_ALL_PREFIX_LENGTH:]
     return folder_path
 
 
@@ -420,8 +450,7 @@ def object_to_package_path(object_path: str) -> str:
 
     if not isinstance(object_path, str):
         return ""
-    package_path = object_path.split(":", 1)[0] # If exists, proceeds to delete the subobject from the path.
-    return package_path.split(".", 1)[0]
+    return object_path.partition(":")[0].partition(".")[0] # Drops the subobject (if present), then the object name.
 
 
 def package_to_object_path(package_path: str) -> str:
@@ -431,35 +460,91 @@ def package_to_object_path(package_path: str) -> str:
     if not isinstance(package_path, str):
         unreal.log_error(f"Invalid package path: {package_path}")
         return ""
-    object_name: str = package_path.rsplit("/", 1)[-1]
-    return f"{package_path}.{object_name}"
+    return f"{package_path}.{package_path.rpartition('/')[2]}"
 
 
 def resolution_to_suffix(size: Tuple[int, int]) -> str:
 # Tries to match the actual image size to a size suffix.
 
-    width = max(size)
-    for threshold, label in [
-        (512, "512"), (1024, "1K"), (2048, "2K"), (4096, "4K"), (8192, "8K")
-    ]:
-        if width <= threshold:
-            return label
-        # Returns the full size if it does not match any suffix threshold.
+    width: int = size[0] if size[0] >= size[1] else size[1] # Longer side, without the max() call.
+    threshold_index: int = bisect_left(_RESOLUTION_THRESHOLDS, width) # First threshold that is >= width.
+    if threshold_index < len(_RESOLUTION_LABELS):
+        return _RESOLUTION_LABELS[threshold_index]
     return f"{width}px"
+    # Returns the full size if it does not match any suffix threshold.
 
 
+@lru_cache(maxsize = 1)
 def validate_export_extension() -> str:
 # Validates the selected output extension set in config.
 # Returns lowercase ext without the "."
-
-    allowed_extensions: set[str] = set(ALLOWED_FILE_TYPES)
-    extensions_aliases: Dict[str, str] = {"jpeg": "jpg"}
+# Cached, as the config doesn't change during a session; an invalid value is reported once.
 
     extension: str = (FILE_TYPE or "").strip().lower().lstrip(".")
-    extension = extensions_aliases.get(extension, extension)
+    extension = _EXT_ALIASES.get(extension, extension)
 
-    if not extension or extension not in allowed_extensions:
-        log_allowed_extensions = ", ".join(sorted(allowed_extensions))
+    if not extension or extension not in _ALLOWED_EXT_SET:
+        log_allowed_extensions = ", ".join(sorted(_ALLOWED_EXT_SET))
         log(f"Invalid file type '{FILE_TYPE}' (allowed: {log_allowed_extensions}); falling back to 'png'", "warn")
         extension = "png"
-    return extension
\ No newline at end of file
+    return extension
+
+
+
+
+#                                       === helpers ===
+
+@lru_cache(maxsize = 1)
+def _get_asset_registry() -> "unreal.AssetRegistry":
+# Resolves the editor's asset registry once; it lives for the whole editor session.
+    return unreal.AssetRegistryHelpers.get_asset_registry()
+
+
+@lru_cache(maxsize = 1)
+def _get_content_browser_subsystem() -> "unreal.ContentBrowserSubsystem":
+# Resolves the Content Browser editor subsystem once; it lives for the whole editor session.
+    return unreal.get_editor_subsystem(unreal.ContentBrowserSubsystem)
+
+
+def _new_export_task(asset: "unreal.Texture2D", file_path: str) -> "unreal.AssetExportTask":
+# Builds an automated, non-prompting export task for the asset.
+
+    export_task = unreal.AssetExportTask()
+    export_task.object = asset
+    export_task.filename = file_path
+    export_task.automated = True
+    export_task.prompt = False
+    export_task.replace_identical = True
+    return export_task
+
+
+@lru_cache(maxsize = 4096)
+def _build_suffix_patterns(type_suffix: str, size_suffix: Optional[str]) -> Tuple[Optional[re.Pattern[str]], Optional[re.Pattern[str]], re.Pattern[str]]:
+# Compiles the naming convention patterns for a type/size suffix pair only once, as the suffixes come from a small fixed set.
+# Patterns are case-sensitive and meant for the lowercase name.
+# Returns (type...size, size...type, ...type); the first two are None without a size suffix.
+
+    separator: str = _SUFFIX_SEPARATOR
+    middle_text: str = _SUFFIX_MIDDLE_TEXT
+
+    type_then_size: Optional[re.Pattern[str]] = None
+    size_then_type: Optional[re.Pattern[str]] = None
+    if size_suffix:
+        type_then_size = re.compile(rf"{separator}{re.escape(type_suffix)}{middle_text}{separator}{re.escape(size_suffix)}$")  # type ... [middle_text] ... size
+        size_then_type = re.compile(rf"{separator}{re.escape(size_suffix)}{middle_text}{separator}{re.escape(type_suffix)}$")  # size ... [middle_text] ... type
+        # Pattern3 = if more variations are necessary.
+
+    only_type_suffix: re.Pattern[str] = re.compile(rf"{separator}{re.escape(type_suffix)}$")
+    return type_then_size, size_then_type, only_type_suffix
+
+
+def _match_suffix_pattern(name_lower: str, type_suffix: str, size_suffix: Optional[str]) -> Optional[re.Match[str]]:
+# Returns the match of the first naming convention pattern found in the lowercase name, or None.
+
+    type_then_size, size_then_type, only_type_suffix = _build_suffix_patterns(type_suffix, size_suffix or None)
+    if type_then_size is not None:
+        match: Optional[re.Match[str]] = type_then_size.search(name_lower) or size_then_type.search(name_lower)
+        if match:
+            return match
+    return only_type_suffix.search(name_lower)
+    # Falls back to this in case only the type suffix is present.
@@ -1,7 +1,6 @@
 
 """ Shared utilities used across all asset processing modules. """
 
-import re
 import unreal
 from typing import Optional
 
@@ -32,24 +31,21 @@ def clear_source_file_for_asset(asset: unreal.Object) -> bool:
 
 LOG_TYPES = ["info", "warn", "error", "skip", "complete"] # Defines log types; the backend handles printing for the Windows CLI and Unreal Engine.
 
+_LOG_DISPATCH = {
+    "info": unreal.log,
+    "warn": unreal.log_warning,
+    "error": unreal.log_error,
+    "skip": unreal.log_error,
+    "complete": unreal.log,
+} # Unreal log function for each of the LOG_TYPES.
+
 def log(message: str, message_kind: str = "info") -> None:
 # Maps different log types to the Unreal log system.
 
-    if message == "":
+    if not message:
         unreal.log("") # Prints an empty line as a separation in the log.
         return
-    if message_kind == "info":
-        unreal.log(f"{message}")
-    elif message_kind == "warn":
-        unreal.log_warning(message)
-    elif message_kind == "error":
-        unreal.log_error(message)
-    elif message_kind == "skip":
-        unreal.log_error(f"{message}")
-    elif message_kind == "complete":
-        unreal.log(f"{message}")
-    else:
-        unreal.log(message)
+    _LOG_DISPATCH.get(message_kind, unreal.log)(message) # Unknown kinds are printed as info.
 
 
 def validate_safe_folder_name(raw_folder_name: Optional[str]) -> None:
@@ -58,7 +54,7 @@ def validate_safe_folder_name(raw_folder_name: Optional[str]) -> None:
     folder_name: str = (raw_folder_name or "").strip()
     if not folder_name:
         return
-    if not re.fullmatch(r"[A-Za-z0-9_]+", folder_name):
+    if not (folder_name.isascii() and folder_name.replace("_", "a").isalnum()): # Letters, digits and underscore only, without the regex engine.
         log(f"Aborted: '{raw_folder_name}' is invalid. Use only letters, digits, and underscore; no spaces", "error")
         # Prints error.
         raise SystemExit(1)
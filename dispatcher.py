@@ -3,7 +3,9 @@
 
 import importlib
 import inspect
-from typing import Any, Optional
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Callable, Optional
 
 import unreal
 
@@ -17,11 +19,14 @@ def run(target_module: str, function_name: str, inject_context: Optional[str] =
 
 # Importing the target module and resolving its function:
     try:
-        module = importlib.import_module(target_module)
+        function: Optional[Callable[..., Any]] = _resolve(target_module, function_name)
     except ModuleNotFoundError as e:
         unreal.log_error(f"[dispatcher] Module not found: {target_module}")
         return
-    function = getattr(module, function_name)
+    if function is None:
+        unreal.log_error(f"[dispatcher] Function not found: {target_module}.{function_name}")
+        return
+    # Checked after the import, so errors raised by the module's own import-time code aren't reported as a missing function.
 
 
 
@@ -63,6 +68,27 @@ def run(target_module: str, function_name: str, inject_context: Optional[str] =
         if debug: unreal.log_error(f"[{function_name}] aborted (code={e.code})")
 
 
+@lru_cache(maxsize = 64)
+def _import_module(module_name: str) -> ModuleType:
+# Imports the module once per session; importlib.reload() updates the same module object, so the cached one stays valid.
+    return importlib.import_module(module_name)
+
+
+def _resolve(module_name: str, attribute_name: str) -> Optional[Callable[..., Any]]:
+# Returns the requested attribute of the module or None if it's missing.
+# Looked up on every call, so functions from a manually reloaded tool module take effect on the next click.
+    return getattr(_import_module(module_name), attribute_name, None)
+
+
+@lru_cache(maxsize = 128)
+def _arity(factory: Callable[..., Any]) -> int:
+# Returns how many parameters the factory declares, or -1 if its signature can't be read; cached per factory.
+    try:
+        return len(inspect.signature(factory).parameters)
+    except (TypeError, ValueError):
+        return -1
+
+
 def _split_module_and_factory(specified: str):
     # Extracts an explicit factory name if provided as "module:factory"; otherwise leaves it None.
     specified = (specified or "").strip()
@@ -81,9 +107,8 @@ def _build_context(inject_context: str, target_module: str, func_name: str, debu
 
 # Importing the context module and determining the factory name:
     mod_name, explicit_factory = _split_module_and_factory(inject_context)
-    module = importlib.import_module(mod_name)
     factory_name = explicit_factory or DEFAULT_FACTORY_NAME
-    factory: str = getattr(module, factory_name, None)
+    factory: Optional[Callable[..., Any]] = _resolve(mod_name, factory_name)
 
 
 
@@ -93,14 +118,12 @@ def _build_context(inject_context: str, target_module: str, func_name: str, debu
             unreal.log_error(f"[dispatcher: build_context] Context '{mod_name}.{factory_name}' not found.")
         return None
 
-    try:
-        signature  = inspect.signature(factory)
-        params = len(signature.parameters)
+    params: int = _arity(factory)
     # Gets how many parameters the factory function declares.
 
 
 # Deriving how many arguments the factory needs:
-    except (TypeError, ValueError):
+    if params < 0:
         if debug:
             unreal.log_error("[dispatcher: build_context] Cannot extract context factory signature.")
         return None
@@ -1,37 +1,37 @@
-from typing import cast
-from pathlib import Path
-
-import unreal
-
-from AssetUtilities.menu_register import MenuEntry, menu_register
-
-
-_here = Path(__file__).resolve()
-
-unreal.log(f">>> Asset Utilities scripts initialized: <<<")
-
-menu_register(
-    "ContentBrowser.AssetContextMenu.Texture2D",
-    cast(list[MenuEntry], [
-        {
-            "label": "Run Channel Packer",
-            "target_module": "AssetUtilities.TextureUtilities.ChannelPacker.channel_packer",
-            "tooltip": "Pack separate textures into single RGB/A texture",
-            # "section_name": "ImportedAssetActions",
-            "also_in_folders": True,
-            "icon": "ClassIcon.Texture2D",
-        },
-        {
-            "label": "Run Color Curve Generator",
-            "target_module": "AssetUtilities.TextureUtilities.LinearColorCurveSampler.linear_color_curve_sampler",
-            "tooltip": "Creates Linear Color Curves with colors sampled from selected textures.",
-            # "section_name": "ImportedAssetActions",
-            "also_in_folders": False,
-            "icon": "ClassIcon.CurveBase",
-        },
-    ]),
-    # main_menu="PythonTexture Tools"
-)
+def _register_all() -> None:
+# Registers all Asset Utilities menu entries; imports are deferred until registration runs.
+
+    import unreal
+
+    from AssetUtilities.menu_register import menu_register
+
+    unreal.log(f">>> Asset Utilities scripts initialized: <<<")
+
+    menu_register(
+        "ContentBrowser.AssetContextMenu.Texture2D",
+        [
+            {
+                "label": "Run Channel Packer",
+                "target_module": "AssetUtilities.TextureUtilities.ChannelPacker.channel_packer",
+                "tooltip": "Pack separate textures into single RGB/A texture",
+                # "section_name": "ImportedAssetActions",
+                "also_in_folders": True,
+                "icon": "ClassIcon.Texture2D",
+            },
+            {
+                "label": "Run Color Curve Generator",
+                "target_module": "AssetUtilities.TextureUtilities.LinearColorCurveSampler.linear_color_curve_sampler",
+                "tooltip": "Creates Linear Color Curves with colors sampled from selected textures.",
+                # "section_name": "ImportedAssetActions",
+                "also_in_folders": False,
+                "icon": "ClassIcon.CurveBase",
+            },
+        ],
+        # main_menu="PythonTexture Tools"
+    )
+
+
+_register_all()
 
 
 
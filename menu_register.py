@@ -2,11 +2,17 @@
 """ Unreal menu integration — registers Python actions in Editor menus and optional submenus. """
 
 import re
-from typing import TypedDict, NotRequired, Tuple, Optional
+from functools import lru_cache
+from typing import Dict, TypedDict, NotRequired, Set, Tuple, Optional
 
 import unreal
 
 
+_NON_ALNUM_RE: re.Pattern[str] = re.compile(r"[^A-Za-z0-9]+") # Runs of characters not allowed in menu names.
+_CAMEL_SPLIT_RE: re.Pattern[str] = re.compile(r"(?<!^)(?=[A-Z])") # Positions before each capital letter but the first one.
+_WHITESPACE_RE: re.Pattern[str] = re.compile(r"\s+")
+
+
 class MenuEntry(TypedDict, total = False):
     label: NotRequired[str] # Falls back to the function name if missing.
     target_module: str # Full dotted path to the Python module, or ".module:func".
@@ -24,25 +30,31 @@ class MenuEntry(TypedDict, total = False):
 # Default Menu:
 SECTION_NAME_DEFAULT  = "AssetUtilities"
 
+_section_cache: Dict[str, Set[str]] = {} # Section names already present in each target menu, keyed by the menu path.
+_pending_refreshes: Dict[str, str] = {} # Widget paths waiting for flush_menu_refresh(), mapped to their target menu.
+_MAX_TARGETED_REFRESHES: int = 8 # Above this many pending widgets a single full refresh is cheaper.
+
+_CMD_TMPL: str = "from AssetUtilities import dispatcher as _d; _d.run(%r, %r, inject_context=%r, debug=%r)"
+_CMD_RELOAD_PREFIX: str = "import importlib; import AssetUtilities.dispatcher; importlib.reload(AssetUtilities.dispatcher); "
+# Python command run by a menu entry: (module path, function name, context factory, debug flag).
+
 def menu_register(
     menu: str,
     entries: list[MenuEntry],
     debug: bool = False,
     submenu: Optional[str] = None,  # Optional submenu name under which all entries are grouped.
+    defer_refresh: bool = False, # Optional: queues the UI refresh for flush_menu_refresh() when registering several menus in a row.
 ) -> bool:
 
 
 # Pre-validation:
     available_menus = unreal.ToolMenus.get()
-    menus = unreal.ToolMenus.get()
-    menu_target = menus.find_menu(menu)
+    menu_target = available_menus.find_menu(menu)
     if not menu_target and debug:
         unreal.log_warning(f"[menu_register] Target menu '{menu}' not available yet. Skipping registration.")
         return False
     # Checks if a specified menu exists
 
-    folder_menu = available_menus.extend_menu("ContentBrowser.FolderContextMenu")
-
     if not entries:
         unreal.log_warning(f"[menu_register] No entries for {menu}.")
         return False
@@ -54,9 +66,13 @@ def menu_register(
     else:
         section_name = SECTION_NAME_DEFAULT
 
-    if not _section_exist(menu_target, section_name):
-        section_label = _name_to_label(section_name)  # Derives label from the name.
+    section_label = _name_to_label(section_name)  # Derives label from the name; also needed for submenus and folder clones.
+    sections: Set[str] = _section_cache.get(menu)
+    if sections is None:
+        sections = _section_cache[menu] = _section_names(menu_target)
+    if section_name not in sections:
         menu_target.add_section(section_name, section_label)
+        sections.add(section_name)
     # Ensures the target section exists. Creates a new one if needed.
 
 
@@ -69,7 +85,22 @@ def menu_register(
         target_menu_for_entries = menu_target
 
 
+# (Optionally) preparing the folder context menu for cloned entries:
+    folder_target: Optional[unreal.ToolMenu] = None
+    needs_folder: bool = any(item.get("also_in_folders") for item in entries)
+    if needs_folder:
+        folder_menu = available_menus.extend_menu("ContentBrowser.FolderContextMenu")
+        folder_menu.add_section(section_name, section_label)
+
+        folder_target = folder_menu
+        if submenu:
+            folder_target = _add_submenu(folder_menu, section_name, section_label, submenu_name, submenu)
+        # Creates a subfolder for all entries if one is already created for "regular" entries.
+    # Only touches the folder context menu when at least one entry is cloned there; set up once for all entries.
+
+
 # Registering each entry:
+    command_template: str = (_CMD_RELOAD_PREFIX + _CMD_TMPL) if debug else _CMD_TMPL # Reloads the dispatcher on each click only while debugging.
     entries_added: int = 0 # Counts how many entries were registered.
     clones_added: int = 0 # Counts how many cloned entries were registered to the folder context menu.
 
@@ -83,11 +114,12 @@ def menu_register(
 
         label = item.get("label", function_name)
         inject_context = item.get("inject_context", "")
+        tooltip_text = item.get("tooltip", "")
+        also_in_folders = item.get("also_in_folders", False)
+        icon_spec = (item.get("icon") or "").strip()
+        # Reads all the entry's options once.
 
-        cmd = (
-            "import importlib; from AssetUtilities import dispatcher as _d; importlib.reload(_d); "
-            f"_d.run({module_path!r}, {function_name!r}, inject_context={inject_context!r}, debug={debug!r})"
-        )
+        cmd = command_template % (module_path, function_name, inject_context, debug)
         # Command executed by the Unreal, using the dispatcher, when the menu entry is clicked.
 
         entry = unreal.ToolMenuEntry(
@@ -99,7 +131,6 @@ def menu_register(
         entry.set_label(label)
         # Adds the button to the menu.
 
-        tooltip_text = item.get("tooltip", "")
         if tooltip_text:
             entry.set_tool_tip(tooltip_text)
         # Adds a tooltip if specified.
@@ -110,7 +141,7 @@ def menu_register(
             string = cmd,
         )
 
-        _apply_icon(entry, item, debug) # (Optionally) creates an icon for the menu.
+        _apply_icon(entry, icon_spec, debug) # (Optionally) creates an icon for the menu.
 
         target_menu_for_entries.add_menu_entry(section_name, entry)
         # Attaches the command to the created button.
@@ -119,14 +150,7 @@ def menu_register(
 
 # (Optionally) registering a clone of each entry to the folder context menu too:
 
-        if item.get("also_in_folders"):
-            folder_menu.add_section(section_name, section_label)
-
-            folder_target = folder_menu
-            if submenu:
-                folder_target = _add_submenu(folder_menu, section_name, section_label, submenu_name, submenu)
-            # Creates a subfolder for all entries if one is already created for "regular" entries.
-
+        if also_in_folders and folder_target is not None:
             clone = unreal.ToolMenuEntry(
                 name = function_name,
                 type = unreal.MultiBlockType.MENU_ENTRY,
@@ -145,7 +169,7 @@ def menu_register(
                 string = cmd,
             )
 
-            _apply_icon(clone, item, debug) # (Optionally) creates an icon for the menu.
+            _apply_icon(clone, icon_spec, debug) # (Optionally) creates an icon for the menu.
 
             folder_target.add_menu_entry(section_name, clone)
             # Attaches the command to the created button.
@@ -156,12 +180,11 @@ def menu_register(
 
 
 # Refreshing the UI:
-    try:
-        path: str = f"{menu}.{submenu_name}" if (submenu and submenu_name) else menu
-        available_menus.refresh_menu_widget(path)
-    except RuntimeError:
-        available_menus.refresh_all_widgets()
-    # Tries a targeted refresh; if that widget isn't available, fall back to a full UI refresh.
+    path: str = f"{menu}.{submenu_name}" if (submenu and submenu_name) else menu
+    if defer_refresh:
+        _pending_refreshes[path] = menu
+    else:
+        _refresh_menus(available_menus, {path: menu})
 
 
 
@@ -182,6 +205,16 @@ def menu_register(
     return True
 
 
+def flush_menu_refresh() -> None:
+# Refreshes all menus registered with defer_refresh=True in one go.
+
+    if not _pending_refreshes:
+        return
+    pending: Dict[str, str] = dict(_pending_refreshes)
+    _pending_refreshes.clear()
+    _refresh_menus(unreal.ToolMenus.get(), pending)
+
+
 
 
 #                                       === helpers ===
@@ -194,20 +227,37 @@ def _add_submenu(parent_menu: unreal.ToolMenu, section_name: str, section_label:
     return sub
 
 
-def _apply_icon(entry: unreal.ToolMenuEntry, item: MenuEntry, debug: bool = False) -> None:
-# Applies an icon based on a general icon key. Defaults to the Editor Style icons.
+def _apply_icon(entry: unreal.ToolMenuEntry, spec: str, debug: bool = False) -> None:
+# Applies an icon based on a general icon key (the entry's stripped "icon" spec). Defaults to the Editor Style icons.
 # But if a given icon doesn't appear because it's from the App Style, it can be switched to the App Style by typing: "AppStyle:icon".
 
 
-    spec = (item.get("icon") or "").strip()
     if not spec:
         return
 
+    icon = _parse_icon_spec(spec)
+    if icon is None:
+        if debug:
+            unreal.log_warning(f"[menu_register][icon] Empty brush after parsing spec='{spec}'")
+        return
+    style_set, big, small = icon
+
+    entry.set_icon(style_set, style_name=big, small_style_name=small)
+
+    if debug:
+        unreal.log(f"[menu_register][icon] applied style='{style_set}' big='{big}' small='{small}'")
+
+
+@lru_cache(maxsize = 64)
+def _parse_icon_spec(spec: str) -> Optional[Tuple[str, str, str]]:
+# Parses an icon spec into (style set, big icon, small icon); the same icons repeat across entries, so it is cached.
+# Returns None if there is no brush name in the spec.
+
     default_style_set: str = "EditorStyle"
 
 # Checking if the icon style is specified:
-    if ":" in spec:
-        style_set_raw, brush_raw = spec.split(":", 1)
+    style_set_raw, separator, brush_raw = spec.partition(":")
+    if separator:
         style_set = style_set_raw.strip()
         brush = brush_raw.strip()
     else:
@@ -215,32 +265,29 @@ def _apply_icon(entry: unreal.ToolMenuEntry, item: MenuEntry, debug: bool = Fals
         brush = spec
     # If not specified, defaults to the Editor Style.
 
-    if not brush and debug:
-        unreal.log_warning(f"[menu_register][icon] Empty brush after parsing spec='{spec}'")
-        return
+    if not brush:
+        return None
 
 
 # Creating a big and small icon pair needed by the UE class:
     if brush.startswith(("ClassIcon.", "ClassThumbnail.")): # e.g., ClassIcon.Texture2D
-        class_   = brush.split(".", 1)[1]
+        class_   = brush.partition(".")[2]
         big   = f"ClassThumbnail.{class_}"
         small = f"ClassIcon.{class_}"
     else:
         big = small = brush  # e.g., "Icons.Save"
 
-
-    entry.set_icon(style_set, style_name=big, small_style_name=small)
-
-    if debug:
-        unreal.log(f"[menu_register][icon] applied style='{style_set}' big='{big}' small='{small}'")
+    return style_set, big, small
 
 
+@lru_cache(maxsize = 256)
 def _label_to_name(label: str) -> str:
     # Derives submenu name from it
-    s = re.sub(r"[^A-Za-z0-9]+", "_", label).strip("_")
+    s = _NON_ALNUM_RE.sub("_", label).strip("_")
     return s or "SubMenu"
 
 
+@lru_cache(maxsize = 256)
 def _name_to_label(name: str) -> str:
 # Derives the menu label from its name.
 # E.g., PythonTextureTools -> Python Texture Tools
@@ -249,39 +296,58 @@ def _name_to_label(name: str) -> str:
     if not name:
         return ""
 
-    name = re.sub(r"(?<!^)(?=[A-Z])", " ", name) # Adds whitespaces before each capital letter but the first one.
-    name = re.sub(r"\s+", " ", name).strip() # In case - deletes multiple whitespaces.
+    name = _CAMEL_SPLIT_RE.sub(" ", name) # Adds whitespaces before each capital letter but the first one.
+    name = _WHITESPACE_RE.sub(" ", name).strip() # In case - deletes multiple whitespaces.
     return name
 
 
-def _section_exist(menu: unreal.ToolMenu, name: str) -> bool:
-# Checks if the menu already contains a section with the given name.
+def _refresh_menus(available_menus: unreal.ToolMenus, paths: Dict[str, str]) -> None:
+# Refreshes the given menu widgets (path: target menu). Tries a targeted refresh; if a widget isn't available, or there
+# are many to refresh, falls back to a single full UI refresh.
+
+    if len(paths) <= _MAX_TARGETED_REFRESHES:
+        try:
+            for path in paths:
+                available_menus.refresh_menu_widget(path)
+            return
+        except RuntimeError:
+            pass
+
+    available_menus.refresh_all_widgets()
+    for menu in paths.values():
+        _section_cache.pop(menu, None) # The menu may have been rebuilt; re-reads its sections next time.
+
+
+def _section_names(menu: unreal.ToolMenu) -> Set[str]:
+# Returns the names of the sections the menu already contains.
 
     try:
-        secs = menu.get_sections()
-        return any(s.name == name for s in secs)
+        return {str(section.name) for section in menu.get_sections()}
     except Exception:
-        return False
+        return set()
 
 
+@lru_cache(maxsize = 128)
 def _split_target_module_name(module_path: str) -> Tuple[str, str]:
 # Allows the function name to be specified in the target_module path, or not.
 # If not, derives the function name from the module name.
+# Cached, as the same target modules come back on every registration.
 
 
     s = (module_path or "").strip()
     if not s:
         return "", ""
-    if ":" in s:
-        mod, func = s.split(":", 1)
+    mod, separator, func = s.partition(":")
+    if separator:
         mod = mod.strip()
         func = func.strip()
         return (mod, func) if mod and func else ("", "")
 
 
-    if "." not in s:
+    _, dot, last = s.rpartition(".")
+    if not dot:
         return "", ""
     # Check to ensure a dotted path is provided.
 
-    return s, s.rsplit(".", 1)[-1]
+    return s, last
     # If no function name is specified in the path, derive it from the module name.
\ No newline at end of file